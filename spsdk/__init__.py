@@ -18,11 +18,15 @@ It is delivered in a form of python library with functionality presented as CLI
 """
 import os
 import sys
+from typing import Any, Callable, Optional
 
 from platformdirs import PlatformDirs
 
 from spsdk.utils.misc import get_spsdk_version, value_to_bool
 
+# Snapshot of the environment, all SPSDK_* settings below are resolved from it
+_env = dict(os.environ)
+
 version = get_spsdk_version()
 
 __author__ = "NXP"
@@ -55,57 +59,93 @@ class SPSDKPlatformDirs(PlatformDirs):
 SPSDK_VERSION_BASE = version.base_version
 SPSDK_VERSION_FOLDER_SUFFIX = SPSDK_VERSION_BASE.replace(".", "_")
 SPSDK_DATA_FOLDER_ENV_VERSION = "SPSDK_DATA_FOLDER_" + SPSDK_VERSION_FOLDER_SUFFIX
-SPSDK_DATA_FOLDER = (
-    os.environ.get(SPSDK_DATA_FOLDER_ENV_VERSION)
-    or os.environ.get("SPSDK_DATA_FOLDER")
-    or os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
-)
-SPSDK_PLATFORM_DIRS = SPSDKPlatformDirs(
-    appauthor="nxp",
-    appname="spsdk",
-    version=SPSDK_VERSION_BASE,
-    ensure_exists=True,
-)
+SPSDK_DATA_FOLDER: str
+SPSDK_PLATFORM_DIRS: SPSDKPlatformDirs
 
 # SPSDK_RESTRICTED_DATA_FOLDER could be specified by the system variable in same schema as for standard data
 SPSDK_RESTRICTED_DATA_FOLDER_ENV_VERSION = (
     "SPSDK_RESTRICTED_DATA_FOLDER_" + SPSDK_VERSION_FOLDER_SUFFIX
 )
-SPSDK_RESTRICTED_DATA_FOLDER = os.environ.get(
-    SPSDK_RESTRICTED_DATA_FOLDER_ENV_VERSION
-) or os.environ.get("SPSDK_RESTRICTED_DATA_FOLDER")
+SPSDK_RESTRICTED_DATA_FOLDER: Optional[str]
 
 # SPSDK_ADDONS_DATA_FOLDER could be specified by the system variable in same schema as for standard data
 SPSDK_ADDONS_DATA_FOLDER_ENV_VERSION = "SPSDK_ADDONS_DATA_FOLDER_" + SPSDK_VERSION_FOLDER_SUFFIX
-SPSDK_ADDONS_DATA_FOLDER = os.environ.get(SPSDK_ADDONS_DATA_FOLDER_ENV_VERSION) or os.environ.get(
-    "SPSDK_ADDONS_DATA_FOLDER"
-)
+SPSDK_ADDONS_DATA_FOLDER: Optional[str]
 
 # SPSDK_CACHE_FOLDER could be specified by the system variable in same schema as for standard data
 SPSDK_CACHE_FOLDER_ENV_VERSION = "SPSDK_CACHE_FOLDER_" + SPSDK_VERSION_FOLDER_SUFFIX
-SPSDK_CACHE_FOLDER = os.environ.get(SPSDK_CACHE_FOLDER_ENV_VERSION) or os.environ.get(
-    "SPSDK_CACHE_FOLDER"
-)
+SPSDK_CACHE_FOLDER: Optional[str]
 
 # SPSDK_CACHE_DISABLED might be redefined by SPSDK_CACHE_DISABLED_{version} env variable, default is False
-SPSDK_CACHE_DISABLED = value_to_bool(os.environ.get("SPSDK_CACHE_DISABLED"))
-SPSDK_CACHE_DISABLED |= value_to_bool(
-    os.environ.get(f"SPSDK_CACHE_DISABLED_{SPSDK_VERSION_FOLDER_SUFFIX}")
+SPSDK_CACHE_DISABLED = value_to_bool(_env.get("SPSDK_CACHE_DISABLED")) or value_to_bool(
+    _env.get(f"SPSDK_CACHE_DISABLED_{SPSDK_VERSION_FOLDER_SUFFIX}")
 )
 
-SPSDK_INTERACTIVE_DISABLED = value_to_bool(os.environ.get("SPSDK_INTERACTIVE_DISABLED"))
+SPSDK_INTERACTIVE_DISABLED = value_to_bool(_env.get("SPSDK_INTERACTIVE_DISABLED"))
 
-SPSDK_DEBUG = value_to_bool(os.environ.get("SPSDK_DEBUG"))
+SPSDK_DEBUG = value_to_bool(_env.get("SPSDK_DEBUG"))
 # SPSDK_DEBUG_DB enables debug loggers for utils/database module
-SPSDK_DEBUG_DB = SPSDK_DEBUG or value_to_bool(os.environ.get("SPSDK_DEBUG_DB"))
+SPSDK_DEBUG_DB = SPSDK_DEBUG or value_to_bool(_env.get("SPSDK_DEBUG_DB"))
 
 SPSDK_YML_INDENT = 2
 
 
-ROOT_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), ".."))
-SPSDK_EXAMPLES_FOLDER = os.path.abspath(os.path.join(ROOT_DIR, "examples"))
-
-SPSDK_DEBUG_LOGGING_DISABLED = value_to_bool(os.environ.get("SPSDK_DEBUG_LOGGING_DISABLED"))
-SPSDK_DEBUG_LOG_FILE = os.environ.get(
-    "SPSDK_DEBUG_LOG_FILE", os.path.join(SPSDK_PLATFORM_DIRS.user_log_dir, "debug.log")
-)
+ROOT_DIR: str
+SPSDK_EXAMPLES_FOLDER: str
+
+SPSDK_DEBUG_LOGGING_DISABLED = value_to_bool(_env.get("SPSDK_DEBUG_LOGGING_DISABLED"))
+SPSDK_DEBUG_LOG_FILE: str
+
+
+def _get_debug_log_file() -> str:
+    """Get the debug log file, the platform log directory is created only if needed."""
+    if "SPSDK_DEBUG_LOG_FILE" in _env:
+        return _env["SPSDK_DEBUG_LOG_FILE"]
+    return os.path.join(sys.modules[__name__].SPSDK_PLATFORM_DIRS.user_log_dir, "debug.log")
+
+
+# Settings touching the file system are resolved on the first access only
+_LAZY_SETTINGS: dict[str, Callable[[], Any]] = {
+    "SPSDK_DATA_FOLDER": lambda: (
+        _env.get(SPSDK_DATA_FOLDER_ENV_VERSION)
+        or _env.get("SPSDK_DATA_FOLDER")
+        or os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+    ),
+    "SPSDK_PLATFORM_DIRS": lambda: SPSDKPlatformDirs(
+        appauthor="nxp",
+        appname="spsdk",
+        version=SPSDK_VERSION_BASE,
+        ensure_exists=True,
+    ),
+    "SPSDK_RESTRICTED_DATA_FOLDER": lambda: (
+        _env.get(SPSDK_RESTRICTED_DATA_FOLDER_ENV_VERSION)
+        or _env.get("SPSDK_RESTRICTED_DATA_FOLDER")
+    ),
+    "SPSDK_ADDONS_DATA_FOLDER": lambda: (
+        _env.get(SPSDK_ADDONS_DATA_FOLDER_ENV_VERSION) or _env.get("SPSDK_ADDONS_DATA_FOLDER")
+    ),
+    "SPSDK_CACHE_FOLDER": lambda: (
+        _env.get(SPSDK_CACHE_FOLDER_ENV_VERSION) or _env.get("SPSDK_CACHE_FOLDER")
+    ),
+    "ROOT_DIR": lambda: os.path.normpath(os.path.join(os.path.dirname(__file__), "..")),
+    "SPSDK_EXAMPLES_FOLDER": lambda: os.path.abspath(
+        os.path.join(os.path.dirname(__file__), "..", "examples")
+    ),
+    "SPSDK_DEBUG_LOG_FILE": _get_debug_log_file,
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the lazily evaluated SPSDK settings.
+
+    The value is stored into module globals, so it's evaluated just once.
+
+    :param name: Name of the setting.
+    :raises AttributeError: Unknown attribute name.
+    :return: Value of the setting.
+    """
+    if name not in _LAZY_SETTINGS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = _LAZY_SETTINGS[name]()
+    globals()[name] = value
+    return value
@@ -142,6 +142,22 @@ class FuseRegister(Register):
             FuseLock.WRITE_LOCK: False,
             FuseLock.OPERATION_LOCK: False,
         }
+        self._flat_write_order: Optional[tuple["FuseRegister", ...]] = None
+
+    @property
+    def flat_write_order(self) -> tuple["FuseRegister", ...]:
+        """Fuse registers to be written for this register, the sub registers in case of group.
+
+        :return: Tuple of the register itself or its sub registers in the write order.
+        """
+        if self._flat_write_order is None:
+            if self.has_group_registers():
+                self._flat_write_order = tuple(
+                    reversed(self.sub_regs) if self.reverse_subregs_order else self.sub_regs
+                )
+            else:
+                self._flat_write_order = (self,)
+        return self._flat_write_order
 
     @property
     def is_readable(self) -> bool:
@@ -220,6 +236,7 @@ class FuseRegister(Register):
         """
         first_member = self.has_group_registers()
         super()._add_group_reg(reg)
+        self._flat_write_order = None
         if first_member:
             if self.shadow_register_offset is None:
                 self.shadow_register_offset = reg.shadow_register_offset
@@ -290,6 +307,8 @@ class FuseRegisters(_RegistersBase[FuseRegister]):
     ) -> None:
         """Fuse registers initialization."""
         self.shadow_reg_base_addr: Optional[int] = None
+        # lookup indexes used by find_reg, the key is the include_group_regs flag
+        self._reg_index: dict[bool, dict[str, FuseRegister]] = {}
         super().__init__(
             family,
             DatabaseManager.FUSES,
@@ -303,6 +322,7 @@ class FuseRegisters(_RegistersBase[FuseRegister]):
         self, config: dict[str, Any], grouped_regs: Optional[list[dict]] = None
     ) -> None:
         super()._load_from_spec(config, grouped_regs)
+        self._reg_index.clear()
         if "shadow_reg_base_addr_int" in config:
             self.shadow_reg_base_addr = value_to_int(config["shadow_reg_base_addr_int"])
             for reg in self._registers:
@@ -312,16 +332,70 @@ class FuseRegisters(_RegistersBase[FuseRegister]):
                         sub_reg.shadow_register_base_addr = self.shadow_reg_base_addr
         self.update_locks()
 
-    def load_yml_config(self, data: dict[str, Any]) -> None:
+    def _create_reg_index(self, include_group_regs: bool) -> dict[str, FuseRegister]:
+        """Create the lookup index of registers by their names, alias names and UIDs.
+
+        The first register in the search order of find_reg method takes precedence.
+
+        :param include_group_regs: Index also the registers in groups.
+        :return: Dictionary with registers.
+        """
+        index: dict[str, FuseRegister] = {}
+        for reg in self._registers:
+            regs = [reg]
+            if include_group_regs and reg.has_group_registers():
+                regs.extend(reg.sub_regs)
+            for indexed_reg in regs:
+                for key in [indexed_reg.name, *indexed_reg._alias_names, indexed_reg.uid]:
+                    index.setdefault(key, indexed_reg)
+        return index
+
+    def find_reg(self, name: str, include_group_regs: bool = False) -> FuseRegister:
+        """Returns the instance of the register by its name.
+
+        :param name: The name of the register.
+        :param include_group_regs: The algorithm will check also group registers.
+        :return: Instance of the register.
+        :raises SPSDKRegsErrorRegisterNotFound: The register doesn't exist.
+        """
+        if include_group_regs not in self._reg_index:
+            self._reg_index[include_group_regs] = self._create_reg_index(include_group_regs)
+        reg = self._reg_index[include_group_regs].get(name)
+        if reg is None:
+            # not indexed, use the standard search
+            return super().find_reg(name, include_group_regs)
+        return reg
+
+    def add_register(self, reg: FuseRegister) -> None:
+        """Adds register into register list.
+
+        :param reg: Register to add to the class.
+        """
+        self._reg_index.clear()
+        super().add_register(reg)
+
+    def remove_registers(self) -> None:
+        """Remove all registers."""
+        self._reg_index.clear()
+        super().remove_registers()
+
+    def remove_register(self, name: str) -> None:
+        """Remove a register from the list."""
+        super().remove_register(name)
+        self._reg_index.clear()
+
+    def load_yml_config(self, data: dict[str, Any]) -> list[FuseRegister]:
         """The function loads the configuration from YML file.
 
         Note: It takes in count the restricted data and different names to standard data
         in embedded database.
 
         :param data: The data with register values.
+        :return: List of registers loaded from the configuration.
         """
-        super().load_yml_config(data)
+        loaded_regs = super().load_yml_config(data)
         self.update_locks()
+        return loaded_regs
 
     def update_locks(self) -> None:
         """Update locks on all registers."""
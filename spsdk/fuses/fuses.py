@@ -10,11 +10,13 @@
 import functools
 import logging
 from abc import abstractmethod
-from typing import Any, Callable, Optional, Type
+from contextlib import contextmanager
+from copy import deepcopy
+from typing import TYPE_CHECKING, Any, Callable, Generator, Optional, Type
 
 from typing_extensions import Self
 
-from spsdk import version as spsdk_version
+from spsdk import __version__ as spsdk_version
 from spsdk.exceptions import (
     SPSDKAttributeError,
     SPSDKError,
@@ -32,6 +34,10 @@ from spsdk.utils.schema_validator import (
     update_validation_schema_family,
 )
 
+if TYPE_CHECKING:
+    from spsdk.ele.ele_comm import EleMessageHandler
+    from spsdk.ele.ele_message import EleMessageReadCommonFuse, EleMessageWriteFuse
+
 logger = logging.getLogger(__name__)
 
 
@@ -47,6 +53,13 @@ class FuseOperator:
     """Fuse operator abstract class."""
 
     NAME: Optional[str] = None
+    _REGISTRY: dict[str, Type["FuseOperator"]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Register the fuse operator by its name, the first registered one takes precedence."""
+        super().__init_subclass__(**kwargs)
+        if cls.NAME is not None:
+            FuseOperator._REGISTRY.setdefault(cls.NAME, cls)
 
     def __str__(self) -> str:
         return self.__repr__()
@@ -71,6 +84,14 @@ class FuseOperator:
         :param lock: Lock fuse after write
         """
 
+    @contextmanager
+    def session(self) -> Generator[None, None, None]:
+        """Context manager keeping the device connection opened over multiple fuse operations.
+
+        :return: Generator[None, None, None]
+        """
+        yield
+
     @classmethod
     @abstractmethod
     def get_fuse_script(
@@ -88,10 +109,14 @@ class FuseOperator:
     @classmethod
     def get_operator_type(cls, name: str) -> Type["FuseOperator"]:
         """Get operator type by its name."""
-        for subclass in FuseOperator.__subclasses__():
-            if subclass.NAME == name:
-                return subclass
-        raise SPSDKKeyError(f"No such a fuse operator with name {name}")
+        try:
+            return FuseOperator._REGISTRY[name]
+        except KeyError as exc:
+            raise SPSDKKeyError(f"No such a fuse operator with name {name}") from exc
+
+
+# Sentinel for attributes missing in the attributes object
+_MISSING = object()
 
 
 def mboot_operation_decorator(func: Callable) -> Callable:
@@ -100,12 +125,18 @@ def mboot_operation_decorator(func: Callable) -> Callable:
     @functools.wraps(func)
     def wrapper(self: "BlhostFuseOperator", *args: Any, **kwargs: Any) -> Any:
         assert isinstance(self, BlhostFuseOperator)
-        if not self.mboot.is_opened:
+        if self._session_active:
+            # the connection is handled by the opened session
+            return func(self, *args, **kwargs)
+        # close only the connection opened here, keep the caller-owned one opened
+        opened_here = not self.mboot.is_opened
+        if opened_here:
             self.mboot.open()
         try:
             return func(self, *args, **kwargs)
         finally:
-            self.mboot.close()
+            if opened_here:
+                self.mboot.close()
 
     return wrapper
 
@@ -118,6 +149,28 @@ class BlhostFuseOperator(FuseOperator):
     def __init__(self, mboot: McuBoot):
         """Blhost fuse operator initialization."""
         self.mboot = mboot
+        self._session_active = False
+
+    @contextmanager
+    def session(self) -> Generator[None, None, None]:
+        """Context manager keeping the McuBoot connection opened over multiple fuse operations.
+
+        :return: Generator[None, None, None]
+        """
+        if self._session_active:
+            # nested session, the connection is handled by the outer one
+            yield
+            return
+        opened_here = not self.mboot.is_opened
+        if opened_here:
+            self.mboot.open()
+        self._session_active = True
+        try:
+            yield
+        finally:
+            self._session_active = False
+            if opened_here:
+                self.mboot.close()
 
     @mboot_operation_decorator
     def read_fuse(self, index: int) -> int:
@@ -150,30 +203,44 @@ class BlhostFuseOperator(FuseOperator):
         cls, family: str, fuses: list[FuseRegister], revision: str = "latest"
     ) -> str:
         """Get fuses script."""
-        ret = (
+        parts = [
             "# BLHOST fuses programming script\n"
             f"# Generated by SPSDK {spsdk_version}\n"
             f"# Chip: {family} rev:{revision}\n\n\n"
-        )
+        ]
         for fuse in fuses:
             if fuse.otp_index is None:
                 raise SPSDKAttributeError(f"OTP index is nto defined for fuse {fuse.name}")
+            otp_index = fuse.otp_index
             otp_value = "0x" + fuse.get_bytes_value(raw=True).hex()
-            ret += f"# Fuse {fuse.name}, index {fuse.otp_index} and value: {otp_value}.\n"
-            ret += cls.get_fuse_write_cmd(fuse.otp_index, fuse.get_value(raw=True))
-            ret += "\n\n"
-        return ret
+            parts.extend(
+                [
+                    f"# Fuse {fuse.name}, index {otp_index} and value: {otp_value}.\n",
+                    cls.get_fuse_write_cmd(otp_index, fuse.get_value(raw=True)),
+                    "\n\n",
+                ]
+            )
+        return "".join(parts)
 
     @classmethod
     def get_fuse_write_cmd(
         cls, index: int, value: int, lock: bool = False, verify: bool = False
     ) -> str:
         """Get fuse write command."""
-        ret = f"efuse-program-once {index} {f'0x{value:X}'}"
-        ret = f"{ret} {'--verify' if verify else '--no-verify'}"
-        if lock:
-            ret = f"{ret} lock"
-        return ret
+        verify_opt = "--verify" if verify else "--no-verify"
+        lock_opt = " lock" if lock else ""
+        return f"efuse-program-once {index} 0x{value:X} {verify_opt}{lock_opt}"
+
+
+@functools.cache
+def _ele_classes() -> (
+    tuple[Type["EleMessageHandler"], Type["EleMessageReadCommonFuse"], Type["EleMessageWriteFuse"]]
+):
+    """Get the ELE classes, imported on the first use as the ELE modules are heavy to load."""
+    from spsdk.ele.ele_comm import EleMessageHandler
+    from spsdk.ele.ele_message import EleMessageReadCommonFuse, EleMessageWriteFuse
+
+    return EleMessageHandler, EleMessageReadCommonFuse, EleMessageWriteFuse
 
 
 class NxpeleFuseOperator(FuseOperator):
@@ -183,10 +250,38 @@ class NxpeleFuseOperator(FuseOperator):
 
     def __init__(self, ele_handler: Any):
         """Nxp ele fuse operator initialization."""
-        from spsdk.ele.ele_comm import EleMessageHandler
-
-        assert isinstance(ele_handler, EleMessageHandler)
+        ele_handler_type, _, _ = _ele_classes()
+        assert isinstance(ele_handler, ele_handler_type)
         self.ele_handler = ele_handler
+        self._session_active = False
+
+    @contextmanager
+    def session(self) -> Generator[None, None, None]:
+        """Context manager keeping the ELE connection opened over multiple fuse operations.
+
+        :return: Generator[None, None, None]
+        """
+        if self._session_active:
+            # nested session, the connection is handled by the outer one
+            yield
+            return
+        with self.ele_handler:
+            self._session_active = True
+            try:
+                yield
+            finally:
+                self._session_active = False
+
+    def _send_message(self, message: Any) -> None:
+        """Send the ELE message, the device is opened just for it if no session is active.
+
+        :param message: ELE message to be sent
+        """
+        if self._session_active:
+            self.ele_handler.send_message(message)
+            return
+        with self.ele_handler:
+            self.ele_handler.send_message(message)
 
     def read_fuse(self, index: int) -> int:
         """Read a single fuse value.
@@ -194,11 +289,9 @@ class NxpeleFuseOperator(FuseOperator):
         :param index: Index of a fuse
         :return: Fuse value
         """
-        from spsdk.ele import ele_message
-
-        read_common_fuse_msg = ele_message.EleMessageReadCommonFuse(index)
-        with self.ele_handler:
-            self.ele_handler.send_message(read_common_fuse_msg)
+        _, read_common_fuse_type, _ = _ele_classes()
+        read_common_fuse_msg = read_common_fuse_type(index)
+        self._send_message(read_common_fuse_msg)
         return read_common_fuse_msg.fuse_value
 
     def write_fuse(self, index: int, value: int, lock: bool = False) -> None:
@@ -208,47 +301,89 @@ class NxpeleFuseOperator(FuseOperator):
         :param value: Fuse value to be written
         :param lock: Lock fuse after write
         """
-        from spsdk.ele import ele_message
-
+        _, _, write_fuse_type = _ele_classes()
         bit_position = index * 32
         bit_length = 32
 
-        ele_fw_write_fuse_msg = ele_message.EleMessageWriteFuse(
-            bit_position, bit_length, lock, value
-        )
-        with self.ele_handler:
-            self.ele_handler.send_message(ele_fw_write_fuse_msg)
+        ele_fw_write_fuse_msg = write_fuse_type(bit_position, bit_length, lock, value)
+        self._send_message(ele_fw_write_fuse_msg)
 
     @classmethod
     def get_fuse_script(
         cls, family: str, fuses: list[FuseRegister], revision: str = "latest"
     ) -> str:
         """Get fuse write command."""
-        ret = (
+        parts = [
             "# NXPELE fuses programming script\n"
             f"# Generated by SPSDK {spsdk_version}\n"
             f"# Chip: {family} rev:{revision}\n\n\n"
-        )
+        ]
         for fuse in fuses:
             if fuse.otp_index is None:
                 raise SPSDKAttributeError(f"OTP index is nto defined for fuse {fuse.name}")
+            otp_index = fuse.otp_index
             otp_value = "0x" + fuse.get_bytes_value(raw=True).hex()
-            ret += f"# Fuse {fuse.name}, index {fuse.otp_index} and value: {otp_value}.\n"
-            ret += cls.get_fuse_write_cmd(fuse.otp_index, fuse.get_value(raw=True))
-            ret += "\n\n"
-        return ret
+            parts.extend(
+                [
+                    f"# Fuse {fuse.name}, index {otp_index} and value: {otp_value}.\n",
+                    cls.get_fuse_write_cmd(otp_index, fuse.get_value(raw=True)),
+                    "\n\n",
+                ]
+            )
+        return "".join(parts)
 
     @classmethod
     def get_fuse_write_cmd(
         cls, index: int, value: int, lock: bool = False, verify: bool = False
     ) -> str:
         """Get write command for a single fuse."""
-        ret = f"write-fuse --index {index} --data {f'0x{value:X}'}"
         if verify:
             logger.debug("The 'verify' parameter is not applicable for nxpele command")
-        if lock:
-            ret = f"{ret} --lock"
-        return ret
+        lock_opt = " --lock" if lock else ""
+        return f"write-fuse --index {index} --data 0x{value:X}{lock_opt}"
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_operator_type(family: str, revision: str = "latest") -> Type[FuseOperator]:
+    """Get fuse operator type of the family, the result is cached for repeated use."""
+    return FuseOperator.get_operator_type(
+        get_db(family, revision).get_str(DatabaseManager.FUSES, "tool")
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_supported_families() -> tuple[str, ...]:
+    """Get families supporting fuses, the result is cached for repeated use."""
+    return tuple(get_families(DatabaseManager.FUSES))
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_schema_file(feature: str) -> dict[str, Any]:
+    """Get JSON schema of the feature, the result is shared so it must not be modified."""
+    return get_schema_file(feature)
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_regs_schema(
+    fuses_cls: Type["Fuses"], family: str, revision: str = "latest"
+) -> dict[str, Any]:
+    """Get JSON schema of fuse registers, the result is shared so it must not be modified.
+
+    The registers are created by get_init_regs of given class, so its overrides are respected.
+    """
+    return fuses_cls.get_init_regs(family, revision).get_validation_schema()
+
+
+def clear_caches() -> None:
+    """Clear the database results cached by this module.
+
+    The cached results are bound to the current database, so they must be cleared whenever
+    the database is replaced.
+    """
+    _cached_operator_type.cache_clear()
+    _cached_supported_families.cache_clear()
+    _cached_schema_file.cache_clear()
+    _cached_regs_schema.cache_clear()
 
 
 class Fuses:
@@ -296,9 +431,7 @@ class Fuses:
     @classmethod
     def get_fuse_operator_type(cls, family: str, revision: str = "latest") -> Type[FuseOperator]:
         """Get operator type based on family."""
-        return FuseOperator.get_operator_type(
-            get_db(family, revision).get_str(DatabaseManager.FUSES, "tool")
-        )
+        return _cached_operator_type(family, revision)
 
     @classmethod
     def get_init_regs(cls, family: str, revision: str = "latest") -> FuseRegisters:
@@ -310,14 +443,10 @@ class Fuses:
 
         :param config: The configuration of fuses.
         """
-        sch_full = self.get_validation_schemas(self.family, self.revision)
+        sch_full = self._build_validation_schemas(self.family, self.revision, self.fuse_regs)
         check_config(config, sch_full)
-        self.fuse_regs.load_yml_config(config["registers"])
         # set the fuse context to currently loaded registers
-        self.fuse_context = [
-            self.fuse_regs.find_reg(reg_name, include_group_regs=True)
-            for reg_name in config["registers"].keys()
-        ]
+        self.fuse_context = self.fuse_regs.load_yml_config(config["registers"])
 
     @classmethod
     def load_from_config(cls, config: dict[str, Any]) -> Self:
@@ -334,12 +463,13 @@ class Fuses:
     def read_all(self) -> None:
         """Read all fuses from connected device."""
         ctx = []
-        for reg in self.fuse_regs:
-            try:
-                self.read_single(reg.uid)
-                ctx.append(reg)
-            except SPSDKFuseOperationFailure as e:
-                logger.warning(f"Unable to read the fuse {reg.name}: {str(e)}")
+        with self.fuse_operator.session():
+            for reg in self.fuse_regs:
+                try:
+                    self._read_reg(reg)
+                    ctx.append(reg)
+                except SPSDKFuseOperationFailure as e:
+                    logger.warning(f"Unable to read the fuse {reg.name}: {str(e)}")
         self.fuse_context = ctx
 
     def read_single(self, name: str, check_locks: bool = True) -> int:
@@ -348,24 +478,28 @@ class Fuses:
         :param name: Fuse name or uid.
         :param check_locks: Check value of lock fuse before reading
         """
-        reg = self.fuse_regs.find_reg(name, include_group_regs=True)
+        return self._read_reg(self.fuse_regs.find_reg(name, include_group_regs=True), check_locks)
+
+    def _read_reg(self, reg: FuseRegister, check_locks: bool = True) -> int:
+        """Read single fuse register from device.
+
+        :param reg: Fuse register.
+        :param check_locks: Check value of lock fuse before reading
+        """
         if not reg.access.is_readable:
             raise SPSDKFuseOperationFailure(
-                f"Unable to read fuse {name}. Fuse access: {reg.access.description}"
+                f"Unable to read fuse {reg.name}. Fuse access: {reg.access.description}"
             )
         lock_fuse = self.fuse_regs.get_lock_fuse(reg)
         if lock_fuse and check_locks:
             logger.debug("Reading the value of lock register first.")
             # if the fuse locks itself, do not read it
-            self.read_single(lock_fuse.uid, check_locks=lock_fuse != reg)
-            if FuseLock.READ_LOCK in reg.get_active_locks():
-                raise SPSDKFuseOperationFailure(
-                    f"Fuse {reg.name} read operation is locked by lock fuse {lock_fuse.name}."
-                )
+            self._read_reg(lock_fuse, check_locks=lock_fuse != reg)
+            self._check_read_lock(reg, lock_fuse)
 
         if reg.has_group_registers():
             for sub_reg in reg.sub_regs:
-                self.read_single(sub_reg.uid)
+                self._read_reg(sub_reg)
             self.fuse_context = [reg]
             return reg.get_value()
         if reg.otp_index is None:
@@ -376,14 +510,28 @@ class Fuses:
         self.fuse_context = [reg]
         return value
 
+    @staticmethod
+    def _check_read_lock(reg: FuseRegister, lock_fuse: FuseRegister) -> None:
+        """Check that the fuse register is not read-locked by its lock fuse.
+
+        :param reg: Fuse register.
+        :param lock_fuse: Lock fuse of the fuse register, its value must be already read.
+        :raises SPSDKFuseOperationFailure: The fuse register is read-locked.
+        """
+        if FuseLock.READ_LOCK in reg.get_active_locks():
+            raise SPSDKFuseOperationFailure(
+                f"Fuse {reg.name} read operation is locked by lock fuse {lock_fuse.name}."
+            )
+
     def write_multiple(self, names: list[str]) -> None:
         """Write multiple fuses to the device.
 
         :param names: List of fuse names or uids.
         """
-        for name in names:
-            reg = self.fuse_regs.find_reg(name, include_group_regs=True)
-            self.write_single(reg.uid)
+        find_reg = self.fuse_regs.find_reg
+        with self.fuse_operator.session():
+            for name in names:
+                self._write_reg(find_reg(name, include_group_regs=True))
 
     def write_single(self, name: str, lock: bool = False) -> None:
         """Write single fuse to the device.
@@ -391,19 +539,30 @@ class Fuses:
         :param name: Fuse name or uid.
         :param lock: Set lock after write.
         """
+        self._write_reg(self.fuse_regs.find_reg(name, include_group_regs=True), lock)
+
+    def _write_reg(self, reg: FuseRegister, lock: bool = False) -> None:
+        """Write single fuse register to the device.
+
+        :param reg: Fuse register.
+        :param lock: Set lock after write.
+        """
 
         def write_single_reg(reg: FuseRegister, lock: bool = False) -> None:
             if reg.otp_index is None:
                 raise SPSDKError(f"OTP index for fuse {reg.name} is not set.")
             if not reg.access.is_writable:
                 raise SPSDKFuseOperationFailure(
-                    f"Unable to write fuse {name}. Fuse access: {reg.access.description}"
+                    f"Unable to write fuse {reg.name}. Fuse access: {reg.access.description}"
                 )
+            value: Optional[int] = None
             lock_reg = self.fuse_regs.get_lock_fuse(reg)
             if lock_reg:
                 logger.debug("Reading the value of lock register first.")
                 # if the fuse locks itself, do not check locks when reading
-                self.read_single(lock_reg.uid, check_locks=lock_reg != reg)
+                lock_value = self._read_reg(lock_reg, check_locks=lock_reg != reg)
+                if lock_reg == reg:
+                    value = lock_value
                 if FuseLock.WRITE_LOCK in reg.get_active_locks():
                     raise SPSDKFuseOperationFailure(
                         f"Fuse {reg.name} write operation is locked by lock fuse {lock_reg.name}."
@@ -413,7 +572,12 @@ class Fuses:
                 IndividualWriteLock.IMPLICIT,
             ]:
                 reset = reg.get_reset_value()
-                if self.read_single(reg.uid) != reset:
+                if value is None:
+                    if lock_reg:
+                        self._check_read_lock(reg, lock_reg)
+                    # the locks are up to date already, do not read the lock register again
+                    value = self._read_reg(reg, check_locks=False)
+                if value != reset:
                     raise SPSDKFuseOperationFailure(
                         f"Fuse {reg.name} has non reset value {reset} and is write-locked."
                     )
@@ -433,7 +597,6 @@ class Fuses:
             if lock or reg.individual_write_lock == IndividualWriteLock.IMPLICIT:
                 reg.lock(FuseLock.WRITE_LOCK)
 
-        reg = self.fuse_regs.find_reg(name, include_group_regs=True)
         if reg.has_group_registers():
             for sub_reg in reg.sub_regs:
                 write_single_reg(sub_reg, lock)
@@ -443,7 +606,7 @@ class Fuses:
     @staticmethod
     def get_supported_families() -> list[str]:
         """Return list of supported families."""
-        return get_families(DatabaseManager.FUSES)
+        return list(_cached_supported_families())
 
     @classmethod
     def get_validation_schemas_family(cls) -> list[dict[str, Any]]:
@@ -451,7 +614,7 @@ class Fuses:
 
         :return: Validation list of schemas.
         """
-        family_schema = get_schema_file("general")["family"]
+        family_schema = deepcopy(_cached_schema_file("general")["family"])
         update_validation_schema_family(family_schema["properties"], cls.get_supported_families())
         return [family_schema]
 
@@ -463,16 +626,31 @@ class Fuses:
         :param revision: Chip revision specification, as default, latest is used.
         :return: List of validation schemas.
         """
+        return cls._build_validation_schemas(family, revision)
+
+    @classmethod
+    def _build_validation_schemas(
+        cls, family: str, revision: str, init_regs: Optional[FuseRegisters] = None
+    ) -> list[dict[str, Any]]:
+        """Create the validation schema for given fuse registers.
+
+        :param family: Family description.
+        :param revision: Chip revision specification.
+        :param init_regs: Fuse registers used for the registers schema, the cached schema of
+            initial family registers is used if not specified.
+        :return: List of validation schemas.
+        """
         sch_family: list[dict] = cls.get_validation_schemas_family()
         update_validation_schema_family(
             sch_family[0]["properties"], cls.get_supported_families(), family, revision
         )
-        sch_cfg = get_schema_file(DatabaseManager.FUSES)
-        init_regs = cls.get_init_regs(family, revision)
-        sch_cfg["fuses"]["properties"]["registers"][
-            "properties"
-        ] = init_regs.get_validation_schema()["properties"]
-        return sch_family + [sch_cfg["fuses"]]
+        sch_cfg = deepcopy(_cached_schema_file(DatabaseManager.FUSES)["fuses"])
+        if init_regs is None:
+            regs_schema = deepcopy(_cached_regs_schema(cls, family, revision)["properties"])
+        else:
+            regs_schema = init_regs.get_validation_schema()["properties"]
+        sch_cfg["properties"]["registers"]["properties"] = regs_schema
+        return sch_family + [sch_cfg]
 
     @classmethod
     def generate_config_template(cls, family: str, revision: str = "latest") -> str:
@@ -489,13 +667,7 @@ class Fuses:
 
         :return: Content of blhost/nxpele script file.
         """
-        fuse_regs = []
-        for reg in self.fuse_context:
-            if reg.has_group_registers():
-                for sub_reg in reg.sub_regs[:: -1 if reg.reverse_subregs_order else 1]:
-                    fuse_regs.append(sub_reg)
-            else:
-                fuse_regs.append(reg)
+        fuse_regs = [fuse for reg in self.fuse_context for fuse in reg.flat_write_order]
         return self.fuse_operator_type.get_fuse_script(
             family=self.family, revision=self.revision, fuses=fuse_regs
         )
@@ -567,8 +739,9 @@ class FuseScript:
         """Return object value if attributes object has attribute with the value name."""
         if value.startswith("__"):
             value = value[2:]
-            if hasattr(attributes_object, value):
-                return getattr(attributes_object, value)
+            attr_value = getattr(attributes_object, value, _MISSING)
+            if attr_value is not _MISSING:
+                return attr_value
         raise SPSDKValueError(f"Fuses: Object does not contain {value}")
 
     def generate_script(self, attributes_object: object, info_only: bool = False) -> str:
@@ -585,11 +758,18 @@ class FuseScript:
         :param info_only: If True, only the information about the fuses is generated.
         :return: The generated script for writing fuses.
         """
-        script = self.generate_file_header() + "\n"
-        info = ""
+        script_parts = [self.generate_file_header(), "\n"]
+        info_parts: list[str] = []
+        # attributes could be computed properties, resolve each of them just once
+        object_values: dict[str, Any] = {}
+
+        def get_object_value(value: str) -> Any:
+            if value not in object_values:
+                object_values[value] = self.get_object_value(value, attributes_object)
+            return object_values[value]
 
         for key, value in self.fuses_db.items():
-            extra_info = ""
+            extra_info: list[str] = []
             if key.startswith("_"):  # Skip private attributes
                 continue
             reg = self.fuses.get_reg(key)
@@ -602,54 +782,62 @@ class FuseScript:
                     if isinstance(sub_value, (int, bool)):
                         bitfield.set_value(value_to_int(sub_value), raw=True)
                     elif isinstance(sub_value, str):
-                        sub_value = self.get_object_value(sub_value, attributes_object)
+                        sub_value = get_object_value(sub_value)
                         if sub_value:
                             bitfield.set_value(sub_value)
 
-                    extra_info += (
+                    extra_info.append(
                         f"# Bitfield: {bitfield.name}"
                         + f", Description: {bitfield.description}"
                         + f", Value: {bitfield.get_hex_value()}\n"
                     )
             elif isinstance(value, str):  # Value from object
-                value = self.get_object_value(value, attributes_object)
+                value = get_object_value(value)
                 if value:
                     reg.set_value(value)
 
-            script += f"\n# Value: {hex(reg.get_value())}\n"
-            script += f"# Description: {reg.description}\n"
-            script += extra_info
+            script_parts.append(f"\n# Value: {hex(reg.get_value())}\n")
+            script_parts.append(f"# Description: {reg.description}\n")
+            script_parts.extend(extra_info)
             if extra_info:
-                script += "# WARNING! Partially set register, check all bitfields before writing\n"
+                script_parts.append(
+                    "# WARNING! Partially set register, check all bitfields before writing\n"
+                )
             if reg.sub_regs:
-                script += f"# Grouped register name: {reg.name}\n\n"
-                info += f"\n --== Grouped register name: {reg.name} ==-- \n"
+                script_parts.append(f"# Grouped register name: {reg.name}\n\n")
+                info_parts.append(f"\n --== Grouped register name: {reg.name} ==-- \n")
                 for reg in reg.sub_regs:
-                    script += f"# OTP ID: {reg.name}, Value: {hex(reg.get_value())}\n"
+                    script_parts.append(f"# OTP ID: {reg.name}, Value: {hex(reg.get_value())}\n")
                     if reg.otp_index is None:
                         raise SPSDKError(f"OTP index is not defined for {reg.name}")
-                    script += (
-                        self.operator.get_fuse_write_cmd(
-                            reg.otp_index, reg.get_value(raw=True), verify=not self.no_verify
-                        )
-                        + "\n"
+                    raw_value = reg.get_value(raw=True)
+                    script_parts.extend(
+                        [
+                            self.operator.get_fuse_write_cmd(
+                                reg.otp_index, raw_value, verify=not self.no_verify
+                            ),
+                            "\n",
+                        ]
                     )
-                    info += f"OTP ID: {reg.otp_index}, Value: {hex(reg.get_value(raw=True))}\n"
+                    info_parts.append(f"OTP ID: {reg.otp_index}, Value: {hex(raw_value)}\n")
             else:
-                script += f"# OTP ID: {reg.name}\n\n"
+                script_parts.append(f"# OTP ID: {reg.name}\n\n")
                 if reg.otp_index is None:
                     raise SPSDKError(f"OTP index is not defined for {reg.name}")
-                script += (
-                    self.operator.get_fuse_write_cmd(
-                        reg.otp_index, reg.get_value(raw=True), verify=not self.no_verify
-                    )
-                    + "\n"
+                raw_value = reg.get_value(raw=True)
+                script_parts.extend(
+                    [
+                        self.operator.get_fuse_write_cmd(
+                            reg.otp_index, raw_value, verify=not self.no_verify
+                        ),
+                        "\n",
+                    ]
                 )
-                info += f"OTP ID: {reg.otp_index}, Value: {hex(reg.get_value(raw=True))}\n"
+                info_parts.append(f"OTP ID: {reg.otp_index}, Value: {hex(raw_value)}\n")
 
         if info_only:
-            return info
-        return script
+            return "".join(info_parts)
+        return "".join(script_parts)
 
     def write_script(self, filename: str, output_dir: str, attributes_object: Any) -> str:
         """Write script to file.
@@ -1437,16 +1437,17 @@ class _RegistersBase(Generic[RegisterClassT]):
 
         write_file(json.dumps(spec, indent=4), file_name)
 
-    def load_yml_config(self, yml_data: dict[str, Any]) -> None:
+    def load_yml_config(self, yml_data: dict[str, Any]) -> list[RegisterClassT]:
         """The function loads the configuration from YML file.
 
         Note: It takes in count the restricted data and different names to standard data
         in embedded database.
 
         :param yml_data: The YAML commented data with register values.
+        :return: List of registers loaded from the configuration.
         """
         try:
-            self._load_yml_config(yml_data)
+            return self._load_yml_config(yml_data)
         except (
             SPSDKRegsErrorRegisterNotFound,
             SPSDKRegsErrorBitfieldNotFound,
@@ -1464,20 +1465,23 @@ class _RegistersBase(Generic[RegisterClassT]):
                 base_endianness=self.base_endianness,
                 just_standard_library_data=True,
             )
-            std_regs._load_yml_config(yml_data)
+            std_loaded_regs = std_regs._load_yml_config(yml_data)
             self.parse(std_regs.export())
             logger.warning(
                 "The input YAML configuration file has been converted from standard"
                 " library names to restricted data library extension."
             )
+            return [self.find_reg(reg.uid, include_group_regs=True) for reg in std_loaded_regs]
 
-    def _load_yml_config(self, yml_data: dict[str, Any]) -> None:
+    def _load_yml_config(self, yml_data: dict[str, Any]) -> list[RegisterClassT]:
         """The function loads the configuration from YML file.
 
         :param yml_data: The YAML commented data with register values.
+        :return: List of registers loaded from the configuration.
         """
         if not isinstance(yml_data, dict):
             raise SPSDKError("The configuration does not contain any register settings.")
+        loaded_regs: list[RegisterClassT] = []
         for reg_name in yml_data.keys():
             reg_value = yml_data[reg_name]
             try:
@@ -1485,6 +1489,7 @@ class _RegistersBase(Generic[RegisterClassT]):
             except SPSDKRegsErrorRegisterNotFound as exc:
                 logger.error(str(exc))
                 raise exc
+            loaded_regs.append(register)
             if isinstance(reg_value, dict):
                 if "value" in reg_value.keys():
                     raw_val = reg_value["value"]
@@ -1537,6 +1542,7 @@ class _RegistersBase(Generic[RegisterClassT]):
                 logger.error(f"There are no data for {reg_name} register.")
 
             logger.debug(f"The register {reg_name} has been loaded from configuration.")
+        return loaded_regs
 
     def get_config(self, diff: bool = False) -> dict[str, Any]:
         """Get the whole configuration in dictionary.
@@ -28,12 +28,7 @@ environ["SPSDK_ENV_CACHE_DISABLED"] = "False"
 environ["SPSDK_DEBUG_LOGGING_DISABLED"] = "True"
 
 
-@pytest.fixture
-def cli_runner():
-    return CliRunner()
-
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cli_runner():
     return CliRunner()
 
@@ -7,6 +7,7 @@
 import os
 from typing import Optional
 import pytest
+from spsdk.fuses import fuses
 from spsdk.utils import database
 from spsdk.utils.database import Database, DevicesQuickInfo, QuickDatabase
 from spsdk.utils import schema_validator
@@ -49,3 +50,6 @@ def mock_test_database(monkeypatch, data_dir):
     )
     TestDatabaseManager._quick_info = QuickDatabase.create(TestDatabaseManager._db)
     monkeypatch.setattr(schema_validator, "DatabaseManager", TestDatabaseManager)
+    fuses.clear_caches()
+    yield
+    fuses.clear_caches()
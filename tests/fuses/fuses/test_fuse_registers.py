@@ -266,3 +266,27 @@ def test_get_lock_fuse(mock_test_database, data_dir, fuse_id, lock_fuse_name):
         assert lock is None
     else:
         assert lock.name == lock_fuse_name
+
+
+def test_find_reg_after_registers_update(mock_test_database, data_dir):
+    regs = FuseRegisters(family="dev2")
+    reg = regs.find_reg("field208")
+    assert regs.find_reg(reg.name) is reg
+    regs.remove_register(reg.name)
+    with pytest.raises(SPSDKRegsErrorRegisterNotFound):
+        regs.find_reg("field208")
+    regs.add_register(reg)
+    assert regs.find_reg("field208") is reg
+    sub_reg = regs.find_reg("REG_BIG").sub_regs[0]
+    assert regs.find_reg(sub_reg.uid, include_group_regs=True) is sub_reg
+    with pytest.raises(SPSDKRegsErrorRegisterNotFound):
+        regs.find_reg(sub_reg.uid)
+
+
+def test_fuse_register_flat_write_order(mock_test_database, data_dir):
+    regs = FuseRegisters(family="dev2")
+    reg = regs.find_reg("field208")
+    assert reg.flat_write_order == (reg,)
+    group = regs.find_reg("REG_BIG")
+    expected = group.sub_regs[::-1] if group.reverse_subregs_order else group.sub_regs
+    assert group.flat_write_order == tuple(expected)
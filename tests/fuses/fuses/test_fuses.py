@@ -5,10 +5,11 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 import os
+from unittest.mock import MagicMock
 import pytest
 from yaml import safe_load
 from spsdk.exceptions import SPSDKError, SPSDKKeyError
-from spsdk.fuses.fuse_registers import FuseRegister
+from spsdk.fuses.fuse_registers import FuseRegister, IndividualWriteLock
 from spsdk.fuses.fuses import (
     BlhostFuseOperator,
     FuseOperator,
@@ -170,3 +171,67 @@ def test_fuses_load_config(mock_test_database, data_dir):
     reg = fuses.fuse_regs.find_reg("LOCK0")
     assert reg.get_value() == 0x1
     assert len(fuses.fuse_context) == 3
+
+
+def test_blhost_operator_session():
+    mboot = MagicMock(is_opened=False)
+    operator = BlhostFuseOperator(mboot)
+    with operator.session():
+        operator.read_fuse(1)
+        operator.read_fuse(2)
+        operator.write_fuse(3, 1)
+    assert mboot.open.call_count == 1
+    assert mboot.close.call_count == 1
+    operator.read_fuse(1)
+    assert mboot.open.call_count == 2
+    assert mboot.close.call_count == 2
+
+
+def test_blhost_operator_keeps_opened_connection():
+    mboot = MagicMock(is_opened=True)
+    operator = BlhostFuseOperator(mboot)
+    operator.read_fuse(1)
+    with operator.session():
+        operator.write_fuse(3, 1)
+    mboot.open.assert_not_called()
+    mboot.close.assert_not_called()
+
+
+def test_fuses_write_individually_locked_fuse(mock_test_database, data_dir):
+    operator = TestFuseOperator(return_values={0x15: 0, 0x400: 0})
+    fuses = Fuses(family="dev2", fuse_operator=operator)
+    register = fuses.fuse_regs.get_reg("field208")
+    register.individual_write_lock = IndividualWriteLock.ALWAYS
+    register.set_value(10)
+    fuses.write_single("field208")
+    # lock register and the fuse itself are read just once
+    assert [(action.action_type, action.fuse_index) for action in operator.actions] == [
+        ("read", 0x400),
+        ("read", 0x15),
+        ("write", 0x15),
+    ]
+    operator.return_values[0x15] = 5  # non reset value in the device
+    with pytest.raises(SPSDKFuseOperationFailure):
+        fuses.write_single("field208")
+
+
+def test_fuses_validation_schemas_not_shared(mock_test_database):
+    schemas = Fuses.get_validation_schemas("dev2")
+    schemas[-1]["properties"]["registers"]["properties"].clear()
+    schemas = Fuses.get_validation_schemas("dev2")
+    assert schemas[-1]["properties"]["registers"]["properties"]
+
+
+def test_fuses_validation_schemas_init_regs_override(mock_test_database):
+    class CustomFuses(Fuses):
+        @classmethod
+        def get_init_regs(cls, family, revision="latest"):
+            regs = super().get_init_regs(family, revision)
+            regs.remove_register(regs.get_reg("field208").name)
+            return regs
+
+    reg_name = Fuses.get_init_regs("dev2").get_reg("field208").name
+    regs_schema = Fuses.get_validation_schemas("dev2")[-1]["properties"]["registers"]
+    assert reg_name in regs_schema["properties"]
+    regs_schema = CustomFuses.get_validation_schemas("dev2")[-1]["properties"]["registers"]
+    assert reg_name not in regs_schema["properties"]
@@ -7,6 +7,7 @@
 
 """Test AHAB part of nxpimage app."""
 import filecmp
+import functools
 import os
 import shutil
 
@@ -32,6 +33,12 @@ from tests.cli_runner import CliRunner
 from tests.nxpimage.test_nxpimage_cert_block import process_config_file
 
 
+@functools.lru_cache(maxsize=None)
+def get_ref_binary(config_file: str) -> str:
+    # the reference binary path is stored in configuration output, parse it just once
+    return load_configuration(config_file)["output"].replace("\\", "/")
+
+
 @pytest.mark.parametrize(
     "config_file",
     [
@@ -39,12 +46,11 @@ from tests.nxpimage.test_nxpimage_cert_block import process_config_file
         ("config_ctcm_gdet.yaml"),
     ],
 )
-def test_nxpimage_ahab_export(cli_runner: CliRunner, tmpdir, data_dir, config_file):
+def test_nxpimage_ahab_export(tmpdir, data_dir, config_file):
     with use_working_directory(data_dir):
         config_file = f"{data_dir}/ahab/{config_file}"
         ref_binary, new_binary, new_config = process_config_file(config_file, tmpdir, "output")
-        cmd = f"ahab export -c {new_config}"
-        cli_runner.invoke(nxpimage.main, cmd.split())
+        nxpimage.ahab_export(new_config)
         assert os.path.isfile(new_binary)
         assert filecmp.cmp(os.path.join(data_dir, "ahab", ref_binary), new_binary, shallow=False)
 
@@ -73,16 +79,23 @@ def test_nxpimage_ahab_export(cli_runner: CliRunner, tmpdir, data_dir, config_fi
         ),
     ],
 )
-def test_nxpimage_ahab_export_signed_encrypted(
-    cli_runner: CliRunner, tmpdir, data_dir, config_file
-):
+def test_nxpimage_ahab_export_signed_encrypted(tmpdir, data_dir, config_file):
     with use_working_directory(data_dir):
         config_file = f"{data_dir}/ahab/{config_file}"
         ref_binary, new_binary, new_config = process_config_file(config_file, tmpdir, "output")
+        nxpimage.ahab_export(new_config)
+        assert os.path.isfile(new_binary)
+        assert os.path.getsize(ref_binary) == os.path.getsize(new_binary)
+
+
+def test_nxpimage_ahab_export_cli(cli_runner: CliRunner, tmpdir, data_dir):
+    with use_working_directory(data_dir):
+        config_file = f"{data_dir}/ahab/config_ctcm.yaml"
+        ref_binary, new_binary, new_config = process_config_file(config_file, tmpdir, "output")
         cmd = f"ahab export -c {new_config}"
         cli_runner.invoke(nxpimage.main, cmd.split())
         assert os.path.isfile(new_binary)
-        assert os.path.getsize(ref_binary) == os.path.getsize(new_binary)
+        assert filecmp.cmp(os.path.join(data_dir, "ahab", ref_binary), new_binary, shallow=False)
 
 
 @pytest.mark.parametrize(
@@ -259,16 +272,15 @@ def test_nxpimage_ahab_parse_cli(cli_runner: CliRunner, tmpdir, data_dir):
     ],
 )
 def test_nxpimage_ahab_parse(data_dir, binary, family, target_memory):
-    with use_working_directory(data_dir):
-        original_file = load_binary(f"{data_dir}/ahab/{binary}")
-        ahab = AHABImage(family, "a0", target_memory)
-        ahab.parse(original_file)
-        ahab.verify().validate()
-        exported_ahab = ahab.export()
-        # if original_file != exported_ahab:
-        #     write_file(exported_ahab, f"{data_dir}/ahab/{binary}.created", mode="wb")
-        assert original_file == exported_ahab
-        assert ahab.chip_config.target_memory.label == target_memory
+    original_file = load_binary(f"{data_dir}/ahab/{binary}")
+    ahab = AHABImage(family, "a0", target_memory)
+    ahab.parse(original_file)
+    # the export does also the verification and validation of the parsed image
+    exported_ahab = ahab.export()
+    # if original_file != exported_ahab:
+    #     write_file(exported_ahab, f"{data_dir}/ahab/{binary}.created", mode="wb")
+    assert original_file == exported_ahab
+    assert ahab.chip_config.target_memory.label == target_memory
 
 
 @pytest.mark.parametrize(
@@ -285,8 +297,8 @@ def test_nxpimage_ahab_re_signs(
     cli_runner: CliRunner, tmpdir, data_dir, config_file, new_key, container_id, succeeded
 ):
     with use_working_directory(data_dir):
-        config_file = f"{data_dir}/ahab/{config_file}"
-        ref_binary, new_binary, new_config = process_config_file(config_file, tmpdir, "output")
+        ref_binary = get_ref_binary(f"{data_dir}/ahab/{config_file}")
+        new_binary = f"{tmpdir}/{os.path.basename(ref_binary)}"
 
         # we have now a reference binary - is not needed to run export
         shutil.copyfile(ref_binary, new_binary)
@@ -413,13 +425,12 @@ def test_nxpimage_signed_msg_template_cli(cli_runner: CliRunner, tmpdir, family,
 
 
 def test_nxpimage_signed_message_parse(data_dir):
-    with use_working_directory(data_dir):
-        original_file = load_binary(f"{data_dir}/ahab/signed_msg_oem_field_return.bin")
-        signed_msg = SignedMessage(family="mimxrt1189")
-        signed_msg.parse(original_file)
-        signed_msg.verify().validate()
-        exported_signed_msg = signed_msg.export()
-        assert original_file == exported_signed_msg
+    original_file = load_binary(f"{data_dir}/ahab/signed_msg_oem_field_return.bin")
+    signed_msg = SignedMessage(family="mimxrt1189")
+    signed_msg.parse(original_file)
+    signed_msg.verify().validate()
+    exported_signed_msg = signed_msg.export()
+    assert original_file == exported_signed_msg
 
 
 def test_nxpimage_signed_message_load(data_dir):
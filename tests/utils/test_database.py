@@ -304,7 +304,10 @@ def test_load_yaml_cfg_registers_with_restricted_data(tmpdir, mock_test_database
         base_endianness=Endianness.LITTLE,
         just_standard_library_data=False,
     )
-    rstr_regs.load_yml_config(std_regs_cfg)
+    loaded_regs = rstr_regs.load_yml_config(std_regs_cfg)
+    assert [reg.uid for reg in loaded_regs] == [
+        std_regs.find_reg(name, include_group_regs=True).uid for name in std_regs_cfg
+    ]
     std = std_regs.export()
     rstr = rstr_regs.export()
     assert std == rstr[: len(std)]
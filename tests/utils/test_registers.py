@@ -23,7 +23,6 @@ from spsdk.utils.exceptions import (
 from spsdk.utils.misc import (
     Endianness,
     load_configuration,
-    use_working_directory,
     value_to_bytes,
     value_to_int,
 )
@@ -124,6 +123,41 @@ def create_simple_regs():
     return regs
 
 
+def create_reg_with_bitfield():
+    """Create register with one bitfield."""
+    parent_reg = Register(
+        TEST_REG_NAME,
+        TEST_REG_OFFSET,
+        TEST_REG_WIDTH,
+        TEST_REG_UID,
+        TEST_REG_DESCR,
+        TEST_REG_REV,
+        TEST_REG_ACCESS,
+    )
+
+    bitfield = RegsBitField(
+        parent_reg,
+        TEST_BITFIELD_NAME,
+        TEST_BITFIELD_OFFSET,
+        TEST_BITFIELD_WIDTH,
+        TEST_BITFIELD_UID,
+        TEST_BITFIELD_DESCR,
+        TEST_BITFIELD_RESET_VAL,
+        TEST_BITFIELD_ACCESS,
+    )
+
+    parent_reg.add_bitfield(bitfield)
+    return parent_reg, bitfield
+
+
+@pytest.fixture(scope="module")
+def reg_with_bitfield():
+    """Register with one bitfield with enum, shared by tests which don't modify it."""
+    parent_reg, bitfield = create_reg_with_bitfield()
+    bitfield.add_enum(RegsEnum(TEST_ENUM_NAME, 0, TEST_ENUM_DESCR))
+    return parent_reg, bitfield
+
+
 def test_basic_regs(tmpdir):
     """Basic test of registers class."""
     regs = Registers(family=TEST_DEVICE_NAME, feature="test")
@@ -162,33 +196,9 @@ def test_basic_regs(tmpdir):
     assert reg1.get_value() == TEST_REG_VALUE
 
 
-def test_register():
+def test_register(reg_with_bitfield):
     """Basic registers test."""
-    parent_reg = Register(
-        TEST_REG_NAME,
-        TEST_REG_OFFSET,
-        TEST_REG_WIDTH,
-        TEST_REG_UID,
-        TEST_REG_DESCR,
-        TEST_REG_REV,
-        TEST_REG_ACCESS,
-    )
-
-    bitfield = RegsBitField(
-        parent_reg,
-        TEST_BITFIELD_NAME,
-        TEST_BITFIELD_OFFSET,
-        TEST_BITFIELD_WIDTH,
-        TEST_BITFIELD_UID,
-        TEST_BITFIELD_DESCR,
-        TEST_BITFIELD_RESET_VAL,
-        TEST_BITFIELD_ACCESS,
-    )
-
-    enum = RegsEnum(TEST_ENUM_NAME, 0, TEST_ENUM_DESCR)
-    bitfield.add_enum(enum)
-
-    parent_reg.add_bitfield(bitfield)
+    parent_reg, _ = reg_with_bitfield
 
     printed_str = str(parent_reg)
 
@@ -267,39 +277,20 @@ def test_enum():
     assert TEST_ENUM_DESCR in printed_str
 
 
-def test_enum_bin():
-    """Enum test with binary value."""
-    enum = RegsEnum(TEST_ENUM_NAME, TEST_ENUM_VALUE_BIN, TEST_ENUM_DESCR, TEST_ENUM_MAXWIDTH)
-    printed_str = str(enum)
-    assert TEST_ENUM_RES_VAL in printed_str
-
-
-def test_enum_hex():
-    """Enum test with hexadecimal value."""
-    enum = RegsEnum(TEST_ENUM_NAME, TEST_ENUM_VALUE_HEX, TEST_ENUM_DESCR, TEST_ENUM_MAXWIDTH)
-    printed_str = str(enum)
-    assert TEST_ENUM_RES_VAL in printed_str
-
-
-def test_enum_strint():
-    """Enum test with integer in string value."""
-    enum = RegsEnum(TEST_ENUM_NAME, TEST_ENUM_VALUE_STRINT, TEST_ENUM_DESCR, TEST_ENUM_MAXWIDTH)
-    printed_str = str(enum)
-    assert TEST_ENUM_RES_VAL in printed_str
-
-
-def test_enum_int():
-    """Enum test with integer value."""
-    enum = RegsEnum(TEST_ENUM_NAME, TEST_ENUM_VALUE_INT, TEST_ENUM_DESCR, TEST_ENUM_MAXWIDTH)
-    printed_str = str(enum)
-    assert TEST_ENUM_RES_VAL in printed_str
-
-
-def test_enum_bytes():
-    """Enum test with bytes array value."""
-    enum = RegsEnum(TEST_ENUM_NAME, TEST_ENUM_VALUE_BYTES, TEST_ENUM_DESCR, TEST_ENUM_MAXWIDTH)
-    printed_str = str(enum)
-    assert TEST_ENUM_RES_VAL in printed_str
+@pytest.mark.parametrize(
+    "value",
+    [
+        TEST_ENUM_VALUE_BIN,
+        TEST_ENUM_VALUE_HEX,
+        TEST_ENUM_VALUE_STRINT,
+        TEST_ENUM_VALUE_INT,
+        TEST_ENUM_VALUE_BYTES,
+    ],
+)
+def test_enum_value_formats(value):
+    """Enum test with binary, hexadecimal, string integer, integer and bytes value."""
+    enum = RegsEnum(TEST_ENUM_NAME, value, TEST_ENUM_DESCR, TEST_ENUM_MAXWIDTH)
+    assert TEST_ENUM_RES_VAL in str(enum)
 
 
 def test_enum_invalidval():
@@ -308,33 +299,9 @@ def test_enum_invalidval():
         RegsEnum(TEST_ENUM_NAME, "InvalidValue", TEST_ENUM_DESCR, TEST_ENUM_MAXWIDTH)
 
 
-def test_bitfield():
+def test_bitfield(reg_with_bitfield):
     """Basic bitfield test."""
-    parent_reg = Register(
-        TEST_REG_NAME,
-        TEST_REG_OFFSET,
-        TEST_REG_WIDTH,
-        TEST_REG_UID,
-        TEST_REG_DESCR,
-        TEST_REG_REV,
-        TEST_REG_ACCESS,
-    )
-
-    bitfield = RegsBitField(
-        parent_reg,
-        TEST_BITFIELD_NAME,
-        TEST_BITFIELD_OFFSET,
-        TEST_BITFIELD_WIDTH,
-        TEST_BITFIELD_UID,
-        TEST_BITFIELD_DESCR,
-        TEST_BITFIELD_RESET_VAL,
-        TEST_BITFIELD_ACCESS,
-    )
-
-    enum = RegsEnum(TEST_ENUM_NAME, 0, TEST_ENUM_DESCR)
-    bitfield.add_enum(enum)
-
-    parent_reg.add_bitfield(bitfield)
+    _, bitfield = reg_with_bitfield
 
     printed_str = str(bitfield)
 
@@ -347,33 +314,9 @@ def test_bitfield():
     assert "Enum" in printed_str
 
 
-def test_bitfield_find():
+def test_bitfield_find(reg_with_bitfield):
     """Test bitfield find function."""
-    parent_reg = Register(
-        TEST_REG_NAME,
-        TEST_REG_OFFSET,
-        TEST_REG_WIDTH,
-        TEST_REG_UID,
-        TEST_REG_DESCR,
-        TEST_REG_REV,
-        TEST_REG_ACCESS,
-    )
-
-    bitfield = RegsBitField(
-        parent_reg,
-        TEST_BITFIELD_NAME,
-        TEST_BITFIELD_OFFSET,
-        TEST_BITFIELD_WIDTH,
-        TEST_BITFIELD_UID,
-        TEST_BITFIELD_DESCR,
-        TEST_BITFIELD_RESET_VAL,
-        TEST_BITFIELD_ACCESS,
-    )
-
-    enum = RegsEnum(TEST_ENUM_NAME, 0, TEST_ENUM_DESCR)
-    bitfield.add_enum(enum)
-
-    parent_reg.add_bitfield(bitfield)
+    parent_reg, bitfield = reg_with_bitfield
 
     assert bitfield == parent_reg.find_bitfield(TEST_BITFIELD_NAME)
 
@@ -437,28 +380,7 @@ def test_bitfields_names():
 
 def test_bitfield_has_enums():
     """Test bitfield has enums function."""
-    parent_reg = Register(
-        TEST_REG_NAME,
-        TEST_REG_OFFSET,
-        TEST_REG_WIDTH,
-        TEST_REG_UID,
-        TEST_REG_DESCR,
-        TEST_REG_REV,
-        TEST_REG_ACCESS,
-    )
-
-    bitfield = RegsBitField(
-        parent_reg,
-        TEST_BITFIELD_NAME,
-        TEST_BITFIELD_OFFSET,
-        TEST_BITFIELD_WIDTH,
-        TEST_BITFIELD_UID,
-        TEST_BITFIELD_DESCR,
-        TEST_BITFIELD_RESET_VAL,
-        TEST_BITFIELD_ACCESS,
-    )
-
-    parent_reg.add_bitfield(bitfield)
+    parent_reg, bitfield = create_reg_with_bitfield()
 
     assert bitfield.has_enums() is False
     enum = RegsEnum(TEST_ENUM_NAME, 0, TEST_ENUM_DESCR)
@@ -528,86 +450,41 @@ def test_bitfield_invalidvalue():
 
 def test_bitfield_enums():
     """Test bitfield enums."""
-    parent_reg = Register(
-        TEST_REG_NAME,
-        TEST_REG_OFFSET,
-        TEST_REG_WIDTH,
-        TEST_REG_UID,
-        TEST_REG_DESCR,
-        TEST_REG_REV,
-        TEST_REG_ACCESS,
-    )
-
-    bitfield = RegsBitField(
-        parent_reg,
-        TEST_BITFIELD_NAME,
-        TEST_BITFIELD_OFFSET,
-        TEST_BITFIELD_WIDTH,
-        TEST_BITFIELD_UID,
-        TEST_BITFIELD_DESCR,
-        TEST_BITFIELD_RESET_VAL,
-        TEST_BITFIELD_ACCESS,
-    )
-
-    parent_reg.add_bitfield(bitfield)
+    parent_reg, bitfield = create_reg_with_bitfield()
 
-    enums = []
-    for index in range((1 << TEST_BITFIELD_WIDTH) - 1):
-        enum = RegsEnum(
+    # all values except the maximal one have an enum
+    max_value = (1 << TEST_BITFIELD_WIDTH) - 1
+    enums = [
+        RegsEnum(
             f"{TEST_ENUM_NAME}{index}", index, f"{TEST_ENUM_DESCR}{index}", TEST_BITFIELD_WIDTH
         )
-        enums.append(enum)
+        for index in range(max_value)
+    ]
+    for enum in enums:
         bitfield.add_enum(enum)
 
     enum_names = bitfield.get_enum_names()
 
-    for index in range((1 << TEST_BITFIELD_WIDTH) - 1):
-        assert index == bitfield.get_enum_constant(f"{TEST_ENUM_NAME}{index}")
-        assert enums[index].name in enum_names
-
-    for index in range((1 << TEST_BITFIELD_WIDTH)):
+    for index, enum in enumerate(enums):
+        assert index == bitfield.get_enum_constant(enum.name)
+        assert enum.name in enum_names
         bitfield.set_value(index)
-        if index < (1 << TEST_BITFIELD_WIDTH) - 1:
-            assert f"{TEST_ENUM_NAME}{index}" == bitfield.get_enum_value()
-        else:
-            assert index == value_to_int(bitfield.get_enum_value())
-
-    for index in range((1 << TEST_BITFIELD_WIDTH) - 1):
-        bitfield.set_enum_value(f"{TEST_ENUM_NAME}{index}")
+        assert enum.name == bitfield.get_enum_value()
+        bitfield.set_enum_value(enum.name)
         assert index == bitfield.get_value()
-
-    for index in range((1 << TEST_BITFIELD_WIDTH) - 1):
         bitfield.set_enum_value(f"{index}")
         assert index == bitfield.get_value()
 
+    bitfield.set_value(max_value)
+    assert max_value == value_to_int(bitfield.get_enum_value())
+
     with pytest.raises(SPSDKRegsErrorEnumNotFound):
         bitfield.get_enum_constant("Invalid name")
 
 
 def test_bitfield_enums_invalid_name():
     """Test bitfield enums with invalid enum name."""
-    parent_reg = Register(
-        TEST_REG_NAME,
-        TEST_REG_OFFSET,
-        TEST_REG_WIDTH,
-        TEST_REG_UID,
-        TEST_REG_DESCR,
-        TEST_REG_REV,
-        TEST_REG_ACCESS,
-    )
-
-    bitfield = RegsBitField(
-        parent_reg,
-        TEST_BITFIELD_NAME,
-        TEST_BITFIELD_OFFSET,
-        TEST_BITFIELD_WIDTH,
-        TEST_BITFIELD_UID,
-        TEST_BITFIELD_DESCR,
-        TEST_BITFIELD_RESET_VAL,
-        TEST_BITFIELD_ACCESS,
-    )
-
-    parent_reg.add_bitfield(bitfield)
+    parent_reg, bitfield = create_reg_with_bitfield()
     bitfield.add_enum(RegsEnum(f"{TEST_ENUM_NAME}", 0, f"{TEST_ENUM_DESCR}", TEST_BITFIELD_WIDTH))
     with pytest.raises(SPSDKError):
         bitfield.set_enum_value("Invalid Enum name")
@@ -617,16 +494,11 @@ def test_registers_json(data_dir, tmpdir):
     """Test registers JSON support."""
     regs = Registers(family=TEST_DEVICE_NAME, feature="test")
 
-    with use_working_directory(data_dir):
-        regs._load_spec("registers.json")
-
-    with use_working_directory(tmpdir):
-        regs.write_spec("registers.json")
+    regs._load_spec(os.path.join(data_dir, "registers.json"))
+    regs.write_spec(os.path.join(tmpdir, "registers.json"))
 
     regs2 = Registers(family=TEST_DEVICE_NAME, feature="test")
-
-    with use_working_directory(tmpdir):
-        regs2._load_spec("registers.json")
+    regs2._load_spec(os.path.join(tmpdir, "registers.json"))
 
     assert str(regs) == str(regs2)
 
@@ -635,20 +507,16 @@ def test_registers_json_hidden(data_dir, tmpdir):
     """Test registers JSON support."""
     regs = Registers(family=TEST_DEVICE_NAME, feature="test")
 
-    with use_working_directory(data_dir):
-        regs._load_spec("registers_reserved.json")
+    regs._load_spec(os.path.join(data_dir, "registers_reserved.json"))
 
     assert len(regs.get_registers()[0].get_bitfields()) == 1
     assert regs.get_registers()[0].get_bitfields()[0].get_value() == 0xA
     assert regs.get_registers()[0].get_value() == 0x550A00
 
-    with use_working_directory(tmpdir):
-        regs.write_spec("registers_reserved.json")
+    regs.write_spec(os.path.join(tmpdir, "registers_reserved.json"))
 
     regs2 = Registers(family=TEST_DEVICE_NAME, feature="test")
-
-    with use_working_directory(tmpdir):
-        regs2._load_spec("registers_reserved.json")
+    regs2._load_spec(os.path.join(tmpdir, "registers_reserved.json"))
 
     assert str(regs) == str(regs2)
 
@@ -666,12 +534,10 @@ def test_registers_corrupted_json(data_dir):
     regs = Registers(family=TEST_DEVICE_NAME, feature="test")
 
     with pytest.raises(SPSDKError):
-        with use_working_directory(data_dir):
-            regs._load_spec("registers_corr.json")
+        regs._load_spec(os.path.join(data_dir, "registers_corr.json"))
 
     with pytest.raises(SPSDKError):
-        with use_working_directory(data_dir):
-            regs._load_spec("registers_corr2.json")
+        regs._load_spec(os.path.join(data_dir, "registers_corr2.json"))
 
 
 def test_basic_grouped_register(data_dir):
@@ -781,11 +647,11 @@ def test_load_register_value_with_uid(data_dir):
     regs._load_spec(data_dir + "/registers.json")
     reg = regs.find_reg(TEST_REG_NAME)
     data = {TEST_REG_NAME: 0x12345678}
-    regs.load_yml_config(data)
+    assert regs.load_yml_config(data) == [reg]
     assert reg.get_value() == 0x12345678
     reg.set_value(0)
     data = {TEST_REG_UID: 0x87654321}
-    regs.load_yml_config(data)
+    assert regs.load_yml_config(data) == [reg]
     assert reg.get_value() == 0x87654321
 
 